@@ -1,5 +1,9 @@
+import io
+import multiprocessing
 import os
+import re
 import sys
+from functools import lru_cache
 
 # Get the parent directory, add it to python path and import the modules
 parent_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
@@ -8,26 +12,167 @@ sys.path.append(parent_dir)
 from Utilities.utils import get_files, get_single_file, read_wordlist, select_font
 
 try:
-    from PyPDF2 import PdfWriter, PdfReader
+    from pypdf import PdfWriter, PdfReader
     from reportlab.lib.colors import HexColor
     from reportlab.lib.pagesizes import A4, landscape
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
     from reportlab.pdfgen import canvas
 except ImportError:
-    print("\nThis script requires the \'reportlab\' and \'PyPDF2\' modules.\n\nPlease install them using \'pip install reportlab PyPDF2\' and try again.\n")
+    print("\nThis script requires the \'reportlab\' and \'pypdf\' modules.\n\nPlease install them using \'pip install reportlab pypdf\' and try again.\n")
     sys.exit(1)
 
 
+# Per-process state initialized once for every pool worker
+_WORKER_STATE = {}
+
+# Certificates are always rendered on a landscape A4 page
+PAGESIZE = landscape(A4)
+
+# Translation table mapping whitespace to underscores for output filenames
+_WHITESPACE_TABLE = str.maketrans({char: '_' for char in ' \t\r\n'})
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+
+## --------------------------------------------------------------------------
+# Function to get the width of a single character in the registered font
+@lru_cache(maxsize=None)
+def _char_width(char, font_size):
+    """
+    Returns the width of a character in the registered custom font.
+
+    Memoized so the TTF metric lookup runs only once per distinct
+    character instead of twice per character per name.
+
+    Args:
+        char (str): A single character.
+        font_size (float): Font size for the name text.
+
+    Returns:
+        float: The character width in points.
+    """
+
+    return pdfmetrics.stringWidth(char, 'CustomFont', font_size)
+
+
+## --------------------------------------------------------------------------
+# Function to initialize a certificate rendering worker process
+def _init_worker(font_file_path, template_bytes, font_size, font_color, position, char_spacing, name_case, output_folder_path):
+    """
+    Initializes the per-process state for a certificate rendering worker.
+
+    Registers the custom TTF font once per process and stores the rendering
+    parameters so that each call to `_render_one` only receives the name.
+
+    Args:
+        font_file_path (str): Path to the TTF font file to register.
+        template_bytes (bytes): Raw contents of the template PDF.
+        font_size (float): Font size for the name text.
+        font_color (str): Hex color code for the name text.
+        position (tuple): (x, y) coordinates for centering the name.
+        char_spacing (float): Extra spacing between characters.
+        name_case (int): 1 for UPPERCASE, 2 for Title Case.
+        output_folder_path (str): Directory to write the generated certificates.
+
+    Returns:
+        None
+    """
+
+    pdfmetrics.registerFont(TTFont('CustomFont', font_file_path))
+    _WORKER_STATE.update(
+        # Parse the template once per worker; renders deep-copy its first page
+        template_reader=PdfReader(io.BytesIO(template_bytes)),
+        font_size=font_size,
+        fill_color=HexColor(font_color),
+        position=position,
+        char_spacing=char_spacing,
+        name_case=name_case,
+        output_folder_path=output_folder_path,
+    )
+
+
+## --------------------------------------------------------------------------
+# Function to render a batch of certificates within a worker process
+def _render_batch(names):
+    """
+    Renders a batch of certificates by overlaying names on the template PDF.
+
+    Draws all name overlays as pages of a single in-memory canvas (one
+    showPage per name) so the canvas and PDF document structure are built
+    once per batch, then merges each overlay page with a copy of the
+    template page and writes one certificate PDF per name.
+
+    Args:
+        names (list): The recipient names to place on the certificates.
+
+    Returns:
+        list: The sanitized filenames (without extension suffix) of the written certificates.
+    """
+
+    font_size = _WORKER_STATE['font_size']
+    position = _WORKER_STATE['position']
+    char_spacing = _WORKER_STATE['char_spacing']
+    fill_color = _WORKER_STATE['fill_color']
+
+    # Draw every overlay as a page of one in-memory canvas; the overlay
+    # streams are left uncompressed since the merge decodes them again anyway
+    filenames = []
+    buffer = io.BytesIO()
+    new_canvas = canvas.Canvas(buffer, pagesize=PAGESIZE, pageCompression=0)
+
+    for name in names:
+        filenames.append(_UNDERSCORE_RUN_RE.sub('_', name.translate(_WHITESPACE_TABLE)))
+
+        # Set the custom font, size, and color (showPage resets the graphics state)
+        new_canvas.setFont('CustomFont', font_size)
+        new_canvas.setFillColor(fill_color)
+
+        # Calculate the width of the name text with character spacing
+        total_text_width = sum(_char_width(char, font_size) + char_spacing for char in name) - char_spacing
+
+        # Calculate the x position to center the text with character spacing
+        centered_x = position[0] - (total_text_width / 2)
+
+        # Draw each character with the specified spacing
+        x_offset = centered_x
+        name = name.upper() if _WORKER_STATE['name_case'] == 1 else name.title()
+
+        for char in name:
+            new_canvas.drawString(x_offset, position[1], char)
+            x_offset += _char_width(char, font_size) + char_spacing
+
+        new_canvas.showPage()
+
+    new_canvas.save()
+
+    # Merge each overlay page with the template
+    buffer.seek(0)
+    new_pdf = PdfReader(buffer)
+
+    for filename, overlay_page in zip(filenames, new_pdf.pages):
+        output = PdfWriter()
+
+        # add_page clones the template page into the writer, so merging the
+        # "watermark" (the overlay) never mutates the cached original
+        page = output.add_page(_WORKER_STATE['template_reader'].pages[0])
+        page.merge_page(overlay_page)
+
+        with open(os.path.join(_WORKER_STATE['output_folder_path'], f"{filename}_certificate.pdf"), "wb") as outputStream:
+            output.write(outputStream)
+
+    return filenames
+
+
 ## --------------------------------------------------------------------------
 # Function to generate the certificates with appropriate names
-def generate_certificates(template_file_path, wordlist_contents):
+def generate_certificates(template_file_path, wordlist_contents, jobs=None):
     """
     Generates personalized certificates by combining a template PDF with names from a wordlist.
 
     Args:
         template_file_path (str): Path to the template PDF file.
         wordlist_contents (list): List of names to be included on the certificates.
+        jobs (int, optional): Number of worker processes to use. Defaults to the CPU count.
 
     Returns:
         str: Path to the directory containing the generated certificates.
@@ -60,9 +205,13 @@ def generate_certificates(template_file_path, wordlist_contents):
         print("\n\nInvalid Input!\nPlease select correct case index.\n\nExiting...\n")
         sys.exit(1)
 
-    # Define a single temporary file path
-    tmp_file = os.path.join(TEMPORARY_DIR_PATH, "tmp_file.pdf")
-    os.makedirs(TEMPORARY_DIR_PATH, exist_ok=True)
+    # Read the template once, workers parse it from memory independently
+    try:
+        with open(template_file_path, "rb") as template_file:
+            template_bytes = template_file.read()
+    except:
+        print("\nError in reading PDF template!\nPlease ensure that the file is in the correct directory and not corrupted.\n\nExiting...\n")
+        sys.exit(1)
 
     counter = 0
     output_folder_path = OUTPUT_DIR_PATH
@@ -72,55 +221,19 @@ def generate_certificates(template_file_path, wordlist_contents):
 
     os.makedirs(output_folder_path, exist_ok=True)
 
+    if not jobs:
+        jobs = os.cpu_count() or 1
+
     print("\n\nGenerating the certificates......\n")
     try:
-        for name in wordlist_contents:
-
-            filename = "_".join(name.split())
-            print(f"{filename}_certificate.pdf")
-
-            # Create a canvas and set the custom font, size, and color
-            new_canvas = canvas.Canvas(tmp_file, pagesize=landscape(A4))
-            new_canvas.setFont('CustomFont', FONT_SIZE)
-            new_canvas.setFillColor(HexColor(FONT_COLOR))
-
-            # Calculate the width of the name text with character spacing
-            total_text_width = sum(pdfmetrics.stringWidth(char, 'CustomFont', FONT_SIZE) + CHAR_SPACING for char in name) - CHAR_SPACING
-
-            # Calculate the x position to center the text with character spacing
-            centered_x = POSITION[0] - (total_text_width / 2)
-
-            # Draw each character with the specified spacing
-            x_offset = centered_x
-            name = name.upper() if name_case == 1 else name.title()
-
-            for char in name:
-                new_canvas.drawString(x_offset, POSITION[1], char)
-                x_offset += pdfmetrics.stringWidth(char, 'CustomFont', FONT_SIZE) + CHAR_SPACING
-
-            new_canvas.save()
-
-            # Merge the canvas with the template
-            packet = open(tmp_file, "rb")
-            new_pdf = PdfReader(packet)
-            try:
-                existing_pdf = PdfReader(open(template_file_path, "rb"))
-            except:
-                print("\nError in reading PDF template!\nPlease ensure that the file is in the correct directory and not corrupted.\n\nExiting...\n")
-                sys.exit(1)
-
-            output = PdfWriter()
-
-            # Add the "watermark" (the new pdf) on the existing page
-            page = existing_pdf.pages[0]
-            page.merge_page(new_pdf.pages[0])
-            output.add_page(page)
-
-            with open(f"{output_folder_path}/{filename}_certificate.pdf", "wb") as outputStream:
-                output.write(outputStream)
-
-            # Clear the canvas for the next iteration (Certificate)
-            new_canvas = None
+        # Rendering is independent per name, so fan the work out across processes
+        # in batches so each worker builds one multi-page canvas per batch
+        batches = [wordlist_contents[i:i + 8] for i in range(0, len(wordlist_contents), 8)]
+        init_args = (font_file_path, template_bytes, FONT_SIZE, FONT_COLOR, POSITION, CHAR_SPACING, name_case, output_folder_path)
+        with multiprocessing.Pool(jobs, initializer=_init_worker, initargs=init_args) as pool:
+            for filenames in pool.imap_unordered(_render_batch, batches):
+                for filename in filenames:
+                    print(f"{filename}_certificate.pdf")
 
         return output_folder_path
 
@@ -155,6 +268,17 @@ if __name__ == "__main__":
 
     automation_script = len(sys.argv) > 1 and sys.argv[1] == "extract_certify_and_email_script"
 
+    # Optional '--jobs N' argument to control the worker process count
+    jobs = None
+    if "--jobs" in sys.argv:
+        try:
+            jobs = int(sys.argv[sys.argv.index("--jobs") + 1])
+            if jobs < 1:
+                raise ValueError()
+        except (IndexError, ValueError):
+            print("\n\nInvalid Input!\nPlease provide a positive number with the \'--jobs\' argument.\n\nExiting...\n")
+            sys.exit(1)
+
     if automation_script:
         DIR_PATH = CERTIFICATE_EMAIL_AUTOMATION_DIR_PATH
     else:
@@ -162,7 +286,6 @@ if __name__ == "__main__":
 
     CERTIFICATE_TEMPLATE_DIR_PATH = os.path.join(DIR_PATH, "Certificate_Template")
     WORDLIST_DIR_PATH = os.path.join(DIR_PATH, "Wordlist")
-    TEMPORARY_DIR_PATH = os.path.join(DIR_PATH, "tmp")
     OUTPUT_DIR_PATH = os.path.join(DIR_PATH, "Generated_Certificates")
 
     os.makedirs(CERTIFICATE_TEMPLATE_DIR_PATH, exist_ok=True)
@@ -206,7 +329,7 @@ if __name__ == "__main__":
         print("\n\nInvalid Input!\nPlease select correct certificate type.\n\nExiting...\n")
         sys.exit(1)
 
-    certificates_dir = generate_certificates(template_file_path, wordlist_contents)
+    certificates_dir = generate_certificates(template_file_path, wordlist_contents, jobs)
 
     # Check command-line arguments
     if automation_script:
@@ -1,8 +1,12 @@
 import os
+import re
 import sys
 import csv
+import itertools
 import logging
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from socket import error, gaierror
@@ -14,9 +18,47 @@ sys.path.append(parent_dir)
 from Utilities.utils import add_attachment, check_attachments, check_body_template, check_csv, check_gmail_app_password, clean_csv_fieldnames, get_files, get_single_file, initialize_necessary_files, load_config, read_email_body_template, sort_csv
 
 
+# Per-thread SMTP connection pool and a lock serializing log/print output
+_SMTP_LOCAL = threading.local()
+_LOG_LOCK = threading.Lock()
+
+# Filenames present in the attachments directory, scanned once per bulk run
+_AVAILABLE_ATTACHMENTS = None
+
+# Sanity pattern for recipient email addresses, compiled once
+EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
 ## ===========================================================================
 ### Functions
 
+# === FUNCTION: GET PERSISTENT SMTP CONNECTION ===
+def _get_smtp_connection():
+    """
+    Returns the calling thread's persistent, authenticated SMTP connection.
+
+    The connection (including STARTTLS and LOGIN) is established once per
+    thread and cached in a thread-local, so subsequent emails skip the TLS
+    handshake and authentication round-trips.
+
+    Returns:
+        smtplib.SMTP: A connected and authenticated SMTP client.
+
+    Raises:
+        smtplib.SMTPAuthenticationError: If authentication with the SMTP server fails.
+        socket.gaierror: If there is a network connection issue.
+    """
+
+    server = getattr(_SMTP_LOCAL, "server", None)
+    if server is None:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+        server.starttls()
+        server.login(SENDER_EMAIL, SENDER_PASSWORD)
+        _SMTP_LOCAL.server = server
+    return server
+
+
+## --------------------------------------------------------------------------
 # === FUNCTION: SEND EMAIL ===
 def send_email(recipient_email, name, subject, body, attachments):
     """
@@ -62,45 +104,55 @@ def send_email(recipient_email, name, subject, body, attachments):
         else:
             for attachment_path in attachments:
                 if attachment_path.strip():  # Ensure path is not empty
+                    # Check against the pre-scanned directory listing instead
+                    # of letting add_attachment stat the file per recipient
+                    if _AVAILABLE_ATTACHMENTS is not None and attachment_path.strip() not in _AVAILABLE_ATTACHMENTS:
+                        with _LOG_LOCK:
+                            logging.error(f"Attachment not found: {attachment_path}")
+                            print(f"Attachment not found: {attachment_path}")
+                        continue
+
                     attachment_path = os.path.join(ATTACHMENTS_DIRECTORY_PATH, attachment_path)
 
                     add_attachment(msg, attachment_path)
 
-        # Connect to Gmail's SMTP server and send the email
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SENDER_EMAIL, SENDER_PASSWORD)
-            server.sendmail(
-                SENDER_EMAIL,
-                [recipient_email],
-                msg.as_string(),
-            )
+        # Send the email over this thread's persistent SMTP connection;
+        # send_message serializes to bytes and can use the server's
+        # 8BITMIME/PIPELINING support, avoiding the as_string round trip
+        server = _get_smtp_connection()
+        try:
+            server.send_message(msg, from_addr=SENDER_EMAIL, to_addrs=[recipient_email])
+        except smtplib.SMTPServerDisconnected:
+            # The pooled connection went stale; reconnect once and retry
+            _SMTP_LOCAL.server = None
+            server = _get_smtp_connection()
+            server.send_message(msg, from_addr=SENDER_EMAIL, to_addrs=[recipient_email])
 
         # Log success
-        logging.info(f"Email sent to {recipient_email}")
-        print(f"Email sent to {recipient_email}")
+        with _LOG_LOCK:
+            logging.info(f"Email sent to {recipient_email}")
+            print(f"Email sent to {recipient_email}")
 
     except smtplib.SMTPAuthenticationError as e:
-        logging.error(f"Authentication failed for {SENDER_EMAIL} with provided password")
-        print(f"Incorrect Gmail App Password!\nAuthentication Failed for \'{SENDER_EMAIL}\' with provided password.\n")
+        with _LOG_LOCK:
+            logging.error(f"Authentication failed for {SENDER_EMAIL} with provided password")
+            print(f"Incorrect Gmail App Password!\nAuthentication Failed for \'{SENDER_EMAIL}\' with provided password.\n")
         sys.exit(1)
     except (gaierror, error) as e:
-        logging.error(f"Network error occurred while sending email to {recipient_email}")
-        print(f"Failed to send Emails....\nCheck your Internet connection\nEmails not sent form recipient name: \'{name}\'\n\nExiting...\n")
-        sys.exit(1)
-    except (KeyboardInterrupt, EOFError):
-        logging.error(f"Email sending interrupted for recipient name: {name}")
-        print(f"\nKeyboard Interrupt!\n\nEmails not sent form recipient name: \'{name}\'\n\nExiting...\n")
+        with _LOG_LOCK:
+            logging.error(f"Network error occurred while sending email to {recipient_email}")
+            print(f"Failed to send Emails....\nCheck your Internet connection\nEmails not sent form recipient name: \'{name}\'\n\nExiting...\n")
         sys.exit(1)
     except Exception as e:
         # Log failure
-        logging.error(f"Failed to send email to {recipient_email}: {e}")
-        print(f"Failed to send email to {recipient_email}: {e}")
+        with _LOG_LOCK:
+            logging.error(f"Failed to send email to {recipient_email}: {e}")
+            print(f"Failed to send email to {recipient_email}: {e}")
 
 
 ## --------------------------------------------------------------------------
 # === FUNCTION: SEND BULK EMAILS ===
-def send_bulk_emails(csv_file_path, body_template_file):
+def send_bulk_emails(csv_file_path, body_template_file, workers=8):
     """
     Sends bulk emails to recipients by reading their details from a CSV file.
 
@@ -111,6 +163,10 @@ def send_bulk_emails(csv_file_path, body_template_file):
         body_template_file (str): Path to the HTML file used as the email body template.
                                   The template should include placeholders for customization
                                   (e.g., "{{name}}").
+        workers (int, optional): Number of sender threads, each holding its own
+                                 persistent SMTP connection. Defaults to 8.
+                                 With workers=1 the emails are sent sequentially
+                                 over a single reused connection.
 
     Raises:
         FileNotFoundError: If the specified CSV file does not exist.
@@ -122,29 +178,35 @@ def send_bulk_emails(csv_file_path, body_template_file):
         - Errors encountered while processing individual rows of the CSV file.
     """
 
-    global ATTACHMENT_MODE
+    global ATTACHMENT_MODE, _AVAILABLE_ATTACHMENTS
+
+    # Scan the attachments directory once so per-recipient lookups are
+    # set membership checks instead of stat syscalls
+    if ATTACHMENT_MODE in ["Common", "Respective"]:
+        _AVAILABLE_ATTACHMENTS = set(os.listdir(ATTACHMENTS_DIRECTORY_PATH))
 
     try:
-        # Read the email body template
+        # Read the email body template and split it on the placeholder once,
+        # so personalizing a recipient's body is a join instead of a full rescan
         body_template = read_email_body_template(body_template_file)
+        body_segments = body_template.split("{{name}}")
 
         # Open the CSV file
         with open(csv_file_path, "r", encoding="utf-8") as csv_file:
-            csv_file.seek(0)  # Reset file pointer
             reader = csv.DictReader(csv_file)
+            rows = iter(reader)
 
-            # Read the common attachments if needed
+            # Peek at the first row for the common attachments if needed,
+            # then push it back so the file is only parsed once
             if ATTACHMENT_MODE == "Common":
-                first_row = next(reader, None)
+                first_row = next(rows, None)
                 if first_row:
                     common_attachments = (
                         first_row["Attachments"].split(";")
                         if first_row.get("Attachments")
                         else []
                     )
-
-            csv_file.seek(0)  # Reset file pointer
-            reader = csv.DictReader(csv_file)  # Reinitialize reader
+                    rows = itertools.chain([first_row], rows)
 
             confirm_send = input(f"\n\nYou are about to send emails to the recipients listed in the CSV file: \'{os.path.basename(csv_file_path)}\'\n\nType \'yes\' to confirm and proceed: ").strip().lower()
             if confirm_send not in ["yes", "y"]:
@@ -153,48 +215,73 @@ def send_bulk_emails(csv_file_path, body_template_file):
 
             print("\n\nSending emails to recipients.....\n\nPlease wait...\nIt might take about 10-15 seconds per email depending on your internet speed.\n")
 
-            row_index = 2
-            for row in reader:
-                try:
-                    if not row.get("Email", "") or not row.get("Full Name", ""):
-                        raise ValueError("Missing recipient email or name in a row.")
-                    else:
-                        # Extract recipient details
-                        recipient_email = row.get("Email", "").lower().strip()
-                        name = row.get("Full Name", "").title().strip()
-
-                    # Determine attachments
-                    if ATTACHMENT_MODE == "Respective":
-                        if row.get("Attachments", ""):
-                            attachments = (row.get("Attachments", "").split(";") if row.get("Attachments", "").strip() else [])
-                        else:
+            # Produce tasks while consumers send: rows are parsed and
+            # submitted one by one, and each worker thread builds and
+            # serializes its MIME messages off the main thread, overlapping
+            # with the network waits of the other senders
+            executor = ThreadPoolExecutor(max_workers=workers)
+            futures = {}
+            try:
+                for row_index, row in enumerate(rows, start=2):
+                    try:
+                        # Extract recipient details once per row
+                        recipient_email = (row.get("Email") or "").strip().lower()
+                        name = (row.get("Full Name") or "").strip().title()
+
+                        if not recipient_email or not name:
+                            raise ValueError("Missing recipient email or name in a row.")
+                        if not EMAIL_RE.fullmatch(recipient_email):
+                            raise ValueError(f"Invalid email address: \'{recipient_email}\'")
+
+                        # Determine attachments
+                        if ATTACHMENT_MODE == "Respective":
+                            if row.get("Attachments", ""):
+                                attachments = (row.get("Attachments", "").split(";") if row.get("Attachments", "").strip() else [])
+                            else:
+                                attachments = []
+
+                        elif ATTACHMENT_MODE == "Common":
+                            attachments = common_attachments
+
+                        elif ATTACHMENT_MODE == "Other":
+                            attachments = f"{name.replace(' ', '_')}_certificate.pdf"
+
+                        elif ATTACHMENT_MODE == "None":
                             attachments = []
 
-                    elif ATTACHMENT_MODE == "Common":
-                        attachments = common_attachments
-
-                    elif ATTACHMENT_MODE == "Other":
-                        attachments = f"{name.title().strip().replace(' ', '_')}_certificate.pdf"
-
-                    elif ATTACHMENT_MODE == "None":
-                        attachments = []
-
-                    else:
-                        print("\nInvalid Attachment Mode specified!\nPlease select among \'Respective\',\'Common\' or \'None\'.")
-                        sys.exit(1)
-
-                    # Customize the email body
-                    personalized_body = body_template.replace("{{name}}", name)
-                    # personalized_body = body_template.replace("{{phone}}", phone)
-
-                    # Send the email
-                    send_email(recipient_email, name, EMAIL_SUBJECT, personalized_body, attachments)
-
-                    row_index += 1
-
-                except Exception as row_error:
-                    logging.error(f"Error processing recipient row\n  Row Index- \'{row_index}\' : {row_error}")
-                    print(f"\nError processing recipient row\n  Row Index- \'{row_index}\' : {row_error}\n")
+                        else:
+                            print("\nInvalid Attachment Mode specified!\nPlease select among \'Respective\',\'Common\' or \'None\'.")
+                            sys.exit(1)
+
+                        # Customize the email body
+                        personalized_body = name.join(body_segments)
+
+                        futures[executor.submit(send_email, recipient_email, name, EMAIL_SUBJECT, personalized_body, attachments)] = row_index
+
+                    except Exception as row_error:
+                        with _LOG_LOCK:
+                            logging.error(f"Error processing recipient row\n  Row Index- \'{row_index}\' : {row_error}")
+                            print(f"\nError processing recipient row\n  Row Index- \'{row_index}\' : {row_error}\n")
+
+                for future in as_completed(futures):
+                    row_index = futures[future]
+                    try:
+                        future.result()
+                    except SystemExit:
+                        raise
+                    except Exception as row_error:
+                        with _LOG_LOCK:
+                            logging.error(f"Error processing recipient row\n  Row Index- \'{row_index}\' : {row_error}")
+                            print(f"\nError processing recipient row\n  Row Index- \'{row_index}\' : {row_error}\n")
+            except KeyboardInterrupt:
+                with _LOG_LOCK:
+                    logging.error("Email sending interrupted by the user")
+                    print("\n\nKeyboard Interrupt!\n\nEmails not sent to the remaining recipients.\n\nExiting...\n")
+                sys.exit(1)
+            finally:
+                # Drop everything still queued; only sends already in flight
+                # on the worker threads run to completion
+                executor.shutdown(cancel_futures=True)
 
     except FileNotFoundError as fnf_error:
         logging.error(f"CSV file not found: {csv_file_path} - {fnf_error}")
@@ -253,6 +340,17 @@ if __name__ == "__main__":
 
     automation_script = len(sys.argv) > 1 and sys.argv[1] == "extract_certify_and_email_script"
 
+    # Optional '--workers N' argument to control the sender thread count
+    workers = 8
+    if "--workers" in sys.argv:
+        try:
+            workers = int(sys.argv[sys.argv.index("--workers") + 1])
+            if workers < 1:
+                raise ValueError()
+        except (IndexError, ValueError):
+            print("\n\nInvalid Input!\nPlease provide a positive number with the \'--workers\' argument.\n\nExiting...\n")
+            sys.exit(1)
+
     SMTP_SERVER = "smtp.gmail.com"
     SMTP_PORT = 587
 
@@ -318,4 +416,4 @@ if __name__ == "__main__":
         format="%(asctime)s - %(levelname)s - %(message)s",
     )
 
-    send_bulk_emails(CSV_FILE_PATH, BODY_TEMPLATE_FILE_PATH)
+    send_bulk_emails(CSV_FILE_PATH, BODY_TEMPLATE_FILE_PATH, workers)
@@ -1,6 +1,8 @@
+import io
 import os
-import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 # Get the parent directory, add it to python path and import the modules
 parent_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
@@ -9,16 +11,32 @@ sys.path.append(parent_dir)
 from Utilities.utils import select_font
 
 try:
+    import numpy as np
     import qrcode
-    from PIL import Image, ImageDraw, ImageFont, ImageOps
-    from qrcode.image.styledpil import StyledPilImage
-    from qrcode.image.styles.colormasks import SolidFillColorMask
-    from qrcode.image.styles.moduledrawers import CircleModuleDrawer
+    from PIL import Image, ImageDraw, ImageFont
 except ImportError:
-    print("This script requires the 'qrcode' and 'pillow' modules.\nPlease install them using 'pip install qrcode pillow' and try again.")
+    print("This script requires the 'qrcode', 'pillow' and 'numpy' modules.\nPlease install them using 'pip install qrcode pillow numpy' and try again.")
     sys.exit(1)
 
 
+# Byte-mode capacity of a version 6 QR code per error correction level
+_V6_BYTE_CAPACITY = {"L": 134, "M": 106, "Q": 74, "H": 58}
+
+# zlib level for PNG output; higher levels buy almost no size on QR content
+PNG_COMPRESS_LEVEL = 1
+
+# Characters not allowed in QR image filenames
+FORBIDDEN_CHARS = frozenset('\\/:*?"<>|')
+
+# Resource paths resolved from this file once at import time, independent of
+# the current working directory, so the module is importable from anywhere
+QRCODES_GENERATOR_DIR_PATH = os.path.abspath(os.path.dirname(__file__))
+FONTS_DIR_PATH = os.path.join(os.path.dirname(QRCODES_GENERATOR_DIR_PATH), 'Fonts')
+
+LOGOS_DIR_PATH = os.path.join(QRCODES_GENERATOR_DIR_PATH, 'Logos')
+OUTPUT_DIR_PATH = os.path.join(QRCODES_GENERATOR_DIR_PATH, 'QRCodes')
+
+
 ## ===========================================================================
 ### Functions
 
@@ -39,7 +57,8 @@ def get_text():
 
     print("\nEnter the text to encode as QR (Press Enter \'Twice\' to finish):\n")
 
-    text_lines = []
+    # Accumulate into one growable buffer instead of a list plus a join pass
+    buffer = io.StringIO()
     enter_pressed = 0
 
     while True:
@@ -53,15 +72,16 @@ def get_text():
             enter_pressed += 1
             if enter_pressed > 1:
                 break
-            text_lines.append("")
+            buffer.write('\n')
             continue
         else:
             enter_pressed = 0
-        text_lines.append(line.rstrip())
+        buffer.write(line.rstrip())
+        buffer.write('\n')
 
-    input_text = '\n'.join(text_lines).strip()
+    input_text = buffer.getvalue().strip()
 
-    if input_text.strip() == "":
+    if input_text == "":
         print("No Input!!!\nCan't generate QR without input text.\n")
         sys.exit(1)
 
@@ -97,14 +117,27 @@ def standard_qr_gen(input_text, error_correction, bg_color):
     )
 
     qr.add_data(input_text)
-    qr.make(fit=True)
-
-    fg_color = "white" if bg_color == "black" else "black"
-
-    qr_img = qr.make_image(fill_color=fg_color, back_color=bg_color)
-    qr_img = qr_img.resize((800, 800), Image.Resampling.LANCZOS)
-
-    qr_image = qr_img.convert('RGB')
+    # The version-fit pass is only needed when the payload can't fit version 6
+    qr.make(fit=len(input_text.encode('utf-8')) > _V6_BYTE_CAPACITY[error_correction])
+
+    # The QR is just a small boolean matrix (quiet zone included); expand
+    # each module to a solid square with one Kronecker product instead of
+    # going through the library's per-module drawing pass
+    modules = np.array(qr.get_matrix(), dtype=np.uint8)
+    box_size = max(1, 800 // modules.shape[0])
+    arr = np.kron(modules, np.full((box_size, box_size), 255, dtype=np.uint8))
+
+    # Map the dark modules onto the requested colors in one vectorized pass;
+    # one grayscale channel is enough, the image is only expanded to RGB at
+    # save time when the format needs it
+    if bg_color != "black":
+        arr = 255 - arr
+
+    qr_image = Image.fromarray(arr, mode="L")
+    # Modules are piecewise-constant, so snapping to exactly 800px only
+    # needs a NEAREST pass instead of a full Lanczos convolution
+    if qr_image.size != (800, 800):
+        qr_image = qr_image.resize((800, 800), Image.Resampling.NEAREST)
 
     return qr_image
 
@@ -136,21 +169,29 @@ def dots_qr_gen(input_text, error_correction, bg_color):
     )
 
     qr.add_data(input_text)
-    qr.make(fit=True)
+    # The version-fit pass is only needed when the payload can't fit version 6
+    qr.make(fit=len(input_text.encode('utf-8')) > _V6_BYTE_CAPACITY["H"])
 
-    # Create the QR code with dot modules
-    qr_img = qr.make_image(
-        image_factory=StyledPilImage,
-        module_drawer=CircleModuleDrawer(),  # Dots for QR code modules
-        color_mask=SolidFillColorMask(front_color=(0,0,0), back_color=(255,255,255)),
-    )
+    # Render at near-final size so only a cheap separable BOX pass remains
+    box_size = max(1, 800 // (qr.modules_count + 2 * qr.border))
+
+    # Pre-render one antialiased circle sprite (supersampled 4x, then
+    # downsampled) to stamp onto every dark module
+    sprite_img = Image.new("L", (box_size * 4, box_size * 4), 0)
+    ImageDraw.Draw(sprite_img).ellipse((0, 0, box_size * 4 - 1, box_size * 4 - 1), fill=255)
+    sprite = np.asarray(sprite_img.resize((box_size, box_size), Image.Resampling.BOX), dtype=np.uint8)
+
+    # Stamp the sprite onto the module matrix (quiet zone included) with a
+    # single Kronecker product instead of one ImageDraw call per module
+    modules = np.array(qr.get_matrix(), dtype=np.uint8)
+    intensity = np.kron(modules, sprite)
 
-    qr_img = qr_img.resize((800, 800), Image.Resampling.LANCZOS)
+    # Map dot intensity onto the requested colors in one vectorized pass
+    arr = intensity if bg_color == "black" else 255 - intensity
 
-    # Convert QR code to an editable PIL image
-    qr_image = qr_img.convert("RGB")
-    if bg_color == "black":
-        qr_image = ImageOps.invert(qr_image)
+    qr_image = Image.fromarray(arr, mode="L")
+    if qr_image.size != (800, 800):
+        qr_image = qr_image.resize((800, 800), Image.Resampling.BOX)
 
     return qr_image
 
@@ -214,103 +255,224 @@ def extension_menu():
 
 
 ## --------------------------------------------------------------------------
-# Function to add an image to the center of the QR Code
-def add_center_image(qr_image, bg_color):
+# Function to load the center logo, resized and pre-composited, cached per size
+@lru_cache(maxsize=4)
+def _get_center_logo(bg_color, size):
     """
-    Overlay a center image on the QR code.
+    Loads, resizes and pre-composites the center logo for a background color.
 
-    Adds a predefined image to the center of the QR code, dynamically scaling it
-    relative to the size of the QR code.
+    The logo is a fixed asset, so the LANCZOS resize and the alpha blend
+    onto the background run once per (background, size); the cached result
+    can then be pasted as an opaque RGB block with no per-pixel alpha math.
 
     Args:
-        qr_image (PIL.Image.Image): The QR code image.
         bg_color (str): Background color of the QR code ('white' or 'black').
+        size (int): Target edge length of the logo in pixels.
 
     Returns:
-        PIL.Image.Image: The QR code image with the center image overlaid.
+        PIL.Image.Image: The pre-composited RGB logo.
+    """
 
-    Raises:
-        Exception: If there is an error in adding the center image.
+    center_image = "White_border_circle.png" if bg_color == "white" else "White_bg_circle.png"
+    logo = Image.open(os.path.join(LOGOS_DIR_PATH, center_image)).convert("RGBA")
+    logo = logo.resize((size, size), Image.Resampling.LANCZOS)
+
+    # A fully opaque logo needs no blend at all, just the mode change
+    if logo.getextrema()[3] == (255, 255):
+        return logo.convert("RGB")
+
+    background = Image.new("RGBA", (size, size), bg_color)
+    return Image.alpha_composite(background, logo).convert("RGB")
+
+
+## --------------------------------------------------------------------------
+# Function to load a TrueType font, cached per (path, size)
+@lru_cache(maxsize=8)
+def _load_font(font_file_path, font_size):
     """
+    Loads a TrueType font, caching it per (path, size).
 
-    # try:
-        # center_image_path = input("\nEnter the Full path of the image to place at the center of the QR code (or press Enter to skip): ").strip()
-    # except (KeyboardInterrupt, EOFError):
-        # print("\n\nKeyboard Interrupt!\n\nExiting....\n")
-        # sys.exit(1)
+    Parsing the TTF and building its glyph tables is the dominant cost of
+    rendering a short title, so repeated calls reuse the loaded font.
 
-    center_image = "White_border_circle.png" if bg_color == "white" else "White_bg_circle.png"
-    center_image_path = os.path.join(LOGOS_DIR_PATH, center_image)
+    Args:
+        font_file_path (str): Path to the TTF font file.
+        font_size (int): Font size in points.
+
+    Returns:
+        PIL.ImageFont.FreeTypeFont: The loaded font object.
+    """
 
-    if not center_image_path or center_image_path.strip() == "":
-        return qr_image
+    return ImageFont.truetype(font_file_path, font_size)
 
-    try:
-        center_image = Image.open(center_image_path)
-        qr_width, qr_height = qr_image.size
 
+## --------------------------------------------------------------------------
+# Function to compose the final canvas: QR code, center logo, optional title
+def compose_qr_image(qr_image, bg_color, title=None, font_file_path=None):
+    """
+    Compose the final image from the QR code, center logo and optional title.
+
+    The title is measured first so the canvas is allocated at its final size
+    in one go; the QR, the logo and the title then each land in their final
+    position directly, with no intermediate expanded image in between.
+
+    Args:
+        qr_image (PIL.Image.Image): The QR code image.
+        bg_color (str): Background color of the QR code ('white' or 'black').
+        title (str, optional): Title to draw above the QR code.
+        font_file_path (str, optional): Path to the TTF font file for the title.
+                                        Falls back to the default font if omitted.
+
+    Returns:
+        PIL.Image.Image: The composed image.
+    """
+
+    FONT_SIZE = 60
+
+    qr_width, qr_height = qr_image.size
+
+    # Measure the title up front to know the final canvas height
+    font = None
+    title_width = 0
+    title_offset = 0
+    if title:
+        try:
+            font = _load_font(font_file_path, FONT_SIZE) if font_file_path else ImageFont.load_default()
+        except IOError:
+            font = ImageFont.load_default()
+
+        # The font can measure its own text; no throwaway drawing context needed
+        title_bbox = font.getbbox(title)
+        title_width = title_bbox[2] - title_bbox[0]
+        title_offset = title_bbox[3] - title_bbox[1] + 5 + 10
+
+    if title_offset:
+        final_image = Image.new(qr_image.mode, (qr_width, qr_height + title_offset), bg_color)
+        final_image.paste(qr_image, (0, title_offset))
+    else:
+        final_image = qr_image
+
+    try:
         # Dynamically scale center image
         scale_factor = 4 #min(4, qr_width // 75)
         center_img_width = qr_width // scale_factor
         center_img_height = qr_height // scale_factor
-        center_image = center_image.resize((center_img_width, center_img_height), Image.Resampling.LANCZOS)
+        center_image = _get_center_logo(bg_color, center_img_width)
 
-        # Place the center image
-        pos = ((qr_width - center_img_width) // 2, (qr_height - center_img_height) // 2)
-        qr_image.paste(center_image, pos, mask=center_image if center_image.mode == 'RGBA' else None)
+        # Place the pre-composited logo as an opaque block (no alpha mask)
+        pos = ((qr_width - center_img_width) // 2, (qr_height - center_img_height) // 2 + title_offset)
+        final_image.paste(center_image, pos)
 
     except Exception as e:
         print(f"\nFailed to add center image: {e}\n")
 
-    return qr_image
+    if title:
+        fill_color = "white" if bg_color == "black" else "black"
+
+        # Draw the title at the top center
+        text_position = ((qr_width - title_width) // 2, 2)
+        ImageDraw.Draw(final_image).text(text_position, title, fill=fill_color, font=font)
+
+    return final_image
 
 
 ## --------------------------------------------------------------------------
-# Function to add a title to the QR Code
-def add_title(qr_image, title, bg_color):
+# Function to build a finished QR image from plain parameters
+def build_qr_image(input_text, qr_style, error_correction, bg_color, title, font_file_path, image_format):
     """
-    Add a title above the QR code.
+    Build a fully composed QR code image without any user interaction.
 
-    Creates a new image with additional space at the top for a title, which is
-    centered and styled with a specified font and color.
+    Runs the pure-compute part of the pipeline: QR generation in the chosen
+    style, mode expansion for the target format, the center logo overlay and
+    the optional title. All arguments are plain values, so this function can
+    be driven from a worker process.
 
     Args:
-        qr_image (PIL.Image.Image): The QR code image.
-        title (str): The text to display as the title.
+        input_text (str): Text to encode in the QR code.
+        qr_style (int): QR style (1 for standard, 2 for dots).
+        error_correction (str): Error correction level ('L', 'M', 'Q', 'H').
         bg_color (str): Background color of the QR code ('white' or 'black').
+        title (str): Title to draw above the QR code, or empty to skip.
+        font_file_path (str): Path to the TTF font for the title, or None.
+        image_format (str): Target image format (e.g., 'PNG', 'JPEG').
 
     Returns:
-        PIL.Image.Image: The QR code image with the title added.
+        PIL.Image.Image: The composed QR code image.
     """
 
-    font_file = select_font(FONTS_DIR_PATH)
-    FONT_SIZE = 60
-    font_file_path = os.path.join(FONTS_DIR_PATH, font_file)
+    qr_func = standard_qr_gen if qr_style == 1 else dots_qr_gen
+    qr_image = qr_func(input_text, error_correction, bg_color)
+
+    # The pipeline works in grayscale; only JPEG needs the RGB expansion
+    if image_format == "JPEG" and qr_image.mode != "RGB":
+        qr_image = qr_image.convert("RGB")
+
+    return compose_qr_image(qr_image, bg_color, title, font_file_path)
+
+
+## --------------------------------------------------------------------------
+# Function to save a QR image with format-specific encoder settings
+def save_qr_image(qr_image, qr_image_path, image_format):
+    """
+    Save a QR code image with fast encoder settings for the chosen format.
+
+    Args:
+        qr_image (PIL.Image.Image): The QR code image to save.
+        qr_image_path (str): Destination path of the image file.
+        image_format (str): Image format to save as (e.g., 'PNG', 'JPEG').
+    """
 
     try:
-        font = ImageFont.truetype(font_file_path, FONT_SIZE)
-    except IOError:
-        font = ImageFont.load_default()
+        save_kwargs = {}
+        if image_format == "PNG":
+            save_kwargs = dict(compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+        elif image_format == "JPEG":
+            save_kwargs = dict(quality=85, optimize=False, progressive=False, subsampling=0)
 
-    draw = ImageDraw.Draw(qr_image)
-    title_bbox = draw.textbbox((0, 0), title, font=font)
-    title_width = title_bbox[2] - title_bbox[0]
-    title_height = title_bbox[3] - title_bbox[1] + 5
+        qr_image.save(qr_image_path, format=image_format, **save_kwargs)
+    except Exception as e:
+        print(f"\nAn Error occured while saving the QRCode file.\n{e}\n\nExiting....\n")
 
-    fill_color = "white" if bg_color == "black" else "black"
 
-    # Create a new image with extra space for the title
-    new_image = Image.new("RGB", (qr_image.width, qr_image.height + title_height + 10), bg_color)
-    draw = ImageDraw.Draw(new_image)
+## --------------------------------------------------------------------------
+# Worker that builds and saves one QR from a tuple of primitives
+def _render_qr_task(params):
+    """
+    Builds and saves one QR code from a parameter tuple.
 
-    # Draw the title at the top center
-    text_position = ((new_image.width - title_width) // 2, 2)
-    draw.text(text_position, title, fill=fill_color, font=font)
+    Args:
+        params (tuple): (input_text, qr_style, error_correction, bg_color,
+                         title, font_file_path, qr_image_path, image_format).
 
-    # Paste the QR code below the title
-    new_image.paste(qr_image, (0, title_height + 10))
+    Returns:
+        str: The path of the saved QR code image.
+    """
+
+    input_text, qr_style, error_correction, bg_color, title, font_file_path, qr_image_path, image_format = params
+    qr_image = build_qr_image(input_text, qr_style, error_correction, bg_color, title, font_file_path, image_format)
+    save_qr_image(qr_image, qr_image_path, image_format)
+    return qr_image_path
+
+
+## --------------------------------------------------------------------------
+# Function to generate many QR codes in parallel
+def main_batch(params_list):
+    """
+    Generate a batch of QR codes across worker processes.
 
-    return new_image
+    Only tuples of plain values cross the process boundary; each worker
+    builds and saves its image independently, so batch jobs scale with the
+    available cores.
+
+    Args:
+        params_list (list): Parameter tuples as accepted by _render_qr_task.
+
+    Returns:
+        list: Paths of the saved QR code images.
+    """
+
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_render_qr_task, params_list))
 
 
 ## --------------------------------------------------------------------------
@@ -365,16 +527,11 @@ def generate_qrcode():
         print("\nInvalid Input!!!\nEnter the number corresponding to the style\n\nExiting....\n")
         sys.exit(1)
 
-    try:
-        qr_func = standard_qr_gen if qr_style == 1 else dots_qr_gen
-        bg_color = "black" if background_color == 2 else "white"
-        qr_image = qr_func(input_text, error_correction, bg_color)
-    except Exception as e:
-        print(f"\nOops! There was an error in creating QR.\n{e}\n")
-        sys.exit(1)
-
-    # Add center image to the QR code
-    qr_image = add_center_image(qr_image, bg_color)
+    # Get the extension type before generating, so the image can be built
+    # in the mode the chosen format needs and saved without a late convert
+    extension, image_format = extension_menu()
+    while extension is None:
+        extension, image_format = extension_menu()
 
     try:
         title = input("\nEnter the title to add at the top of the QR code (or press Enter to skip): ").strip()
@@ -382,15 +539,23 @@ def generate_qrcode():
         print("\n\nKeyboard Interrupt!\n\nExiting....\n")
         sys.exit(1)
 
-    if title:
-        qr_image = add_title(qr_image, title, bg_color)
+    # Resolve the title font interactively, keeping build_qr_image prompt-free
+    font_file_path = os.path.join(FONTS_DIR_PATH, select_font(FONTS_DIR_PATH)) if title else None
+
+    try:
+        bg_color = "black" if background_color == 2 else "white"
+        qr_image = build_qr_image(input_text, qr_style, error_correction, bg_color, title, font_file_path, image_format)
+    except Exception as e:
+        print(f"\nOops! There was an error in creating QR.\n{e}\n")
+        sys.exit(1)
+
     try:
         filename = input("\nEnter the filename for the QR code image: ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\n\nKeyboard Interrupt!\n\nExiting....\n")
         sys.exit(1)
 
-    if re.search(FORBIDDEN_CHARS, filename):
+    if not FORBIDDEN_CHARS.isdisjoint(filename):
         print("\nInvalid filename! QR code creation failed.\nFilename can't contain \\/:*?\"<>| symbols\n")
         sys.exit(1)
 
@@ -398,25 +563,22 @@ def generate_qrcode():
         filename = "qrcode"
         print("Filename not specified! Naming the file as \'qrcode\'")
 
-    # Get the extension type
-    extension, image_format = extension_menu()
-    while extension is None:
-        extension, image_format = extension_menu()
-
     os.makedirs(OUTPUT_DIR_PATH, exist_ok=True)
-    qr_image_path =  os.path.join(OUTPUT_DIR_PATH, f"{filename}.{extension}")
 
-    # Handle if QR Code Image has existing filename
+    # Handle if QR Code Image has existing filename, checking candidates
+    # against one directory scan instead of one stat syscall per try
+    with os.scandir(OUTPUT_DIR_PATH) as entries:
+        existing_names = {entry.name for entry in entries}
+
+    qr_image_name = f"{filename}.{extension}"
     counter = 1
-    while os.path.exists(qr_image_path):
-        qr_image_path = os.path.join(OUTPUT_DIR_PATH, f"{filename}({counter}).{extension}")
+    while qr_image_name in existing_names:
+        qr_image_name = f"{filename}({counter}).{extension}"
         counter += 1
 
-    try:
-        # Save the QR Code
-        qr_image.save(qr_image_path, format=image_format)
-    except Exception as e:
-        print(f"\nAn Error occured while saving the QRCode file.\n{e}\n\nExiting....\n")
+    qr_image_path = os.path.join(OUTPUT_DIR_PATH, qr_image_name)
+
+    save_qr_image(qr_image, qr_image_path, image_format)
 
     return qr_image_path
 
@@ -444,14 +606,6 @@ if __name__ == "__main__":
                     invalid input is provided.
     """
 
-    FORBIDDEN_CHARS = r'[\/:*?"<>|]'
-
-    QRCODES_GENERATOR_DIR_PATH = os.path.abspath(os.path.dirname(__file__))
-    FONTS_DIR_PATH = os.path.join(os.path.dirname(QRCODES_GENERATOR_DIR_PATH), 'Fonts')
-
-    LOGOS_DIR_PATH = os.path.join(QRCODES_GENERATOR_DIR_PATH, 'Logos')
-    OUTPUT_DIR_PATH = os.path.join(QRCODES_GENERATOR_DIR_PATH, 'QRCodes')
-
     print("\n" + " QR Code Generator ".center(29, "-"))
 
     qr_image_path = generate_qrcode()
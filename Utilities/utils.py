@@ -1,9 +1,10 @@
+import base64
+import io
 import os
 import re
 import csv
 import json
 import logging
-from email import encoders
 from email.mime.base import MIMEBase
 from string import ascii_letters
 
@@ -21,12 +22,30 @@ default_html_code = """<!-- <html>
 ## ===========================================================================
 ### Functions
 
+# Cache of already-encoded attachment parts keyed on (path, modification time)
+_attachment_parts_cache = {}
+
+# Read buffer for full-file reads; 1 MiB cuts the syscall count well below
+# what the default 8 KiB buffer needs on multi-MB CSVs and attachments
+_READ_BUFFER_SIZE = 1 << 20
+
+# Attachment encoding chunk; 57-byte groups map to whole 76-char base64 lines
+_ENCODE_CHUNK_SIZE = 57 * 1024
+
+# Deletes every character allowed in a name; whatever survives is invalid
+_VALID_NAME_CHARS_TABLE = str.maketrans('', '', ascii_letters + ' ')
+
+
 ## --------------------------------------------------------------------------
 # Function to add attachments to the message object
 def add_attachment(msg, attachment_path):
     """
     Attaches a file to an email message.
 
+    The encoded MIME part is cached keyed on the file path and modification
+    time, so an attachment shared across recipients is read and
+    base64-encoded only once instead of once per email.
+
     Args:
         msg (email.mime.multipart.MIMEMultipart): The email message object to which the file will be attached.
         attachment_path (str): The file path of the attachment.
@@ -39,20 +58,60 @@ def add_attachment(msg, attachment_path):
     """
 
     try:
-        attachment = MIMEBase("application", "octet-stream")
-        with open(attachment_path.strip(), "rb") as file:
-            attachment.set_payload(file.read())
-        encoders.encode_base64(attachment)
-        attachment.add_header(
-            "Content-Disposition",
-            f"attachment; filename={os.path.basename(attachment_path)}",
-        )
+        path = attachment_path.strip()
+        cache_key = (path, os.path.getmtime(path))
+        attachment = _attachment_parts_cache.get(cache_key)
+        if attachment is None:
+            attachment = MIMEBase("application", "octet-stream")
+            # Base64-encode the file chunk by chunk; only the encoded payload
+            # is ever held whole, not the raw bytes alongside it
+            buffer = io.BytesIO()
+            with open(path, "rb", buffering=_READ_BUFFER_SIZE) as file:
+                while True:
+                    chunk = file.read(_ENCODE_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    encoded = base64.b64encode(chunk)
+                    for start in range(0, len(encoded), 76):
+                        buffer.write(encoded[start:start + 76])
+                        buffer.write(b"\n")
+            attachment.set_payload(buffer.getvalue().decode("ascii"))
+            attachment.add_header("Content-Transfer-Encoding", "base64")
+            attachment.add_header(
+                "Content-Disposition",
+                f"attachment; filename={os.path.basename(attachment_path)}",
+            )
+            _attachment_parts_cache[cache_key] = attachment
         msg.attach(attachment)
     except FileNotFoundError:
         logging.error(f"Attachment not found: {attachment_path}")
         print(f"Attachment not found: {attachment_path}")
 
 
+## --------------------------------------------------------------------------
+# Function to snapshot a directory's entry names in one scan
+def _list_dir_names(directory):
+    """
+    Returns the set of entry names inside a directory.
+
+    A single os.scandir pass replaces one stat syscall per membership test.
+    A missing directory yields an empty set, matching the per-file
+    os.path.exists behaviour it replaces.
+
+    Args:
+        directory (str): Path of the directory to scan.
+
+    Returns:
+        set: Names of all entries in the directory.
+    """
+
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 ## --------------------------------------------------------------------------
 # Function to check the attachment's presence
 def check_attachments(csv_file_path, attachments_dir_path=None, attachment_mode=None, automation_dir_path=None):
@@ -74,35 +133,46 @@ def check_attachments(csv_file_path, attachments_dir_path=None, attachment_mode=
     if not automation_dir_path:
         print("\nChecking the attachments as per the provided Attachment Mode in config file...")
 
-    with open(csv_file_path, "r", encoding="utf-8") as csv_file:
-        csv_file.seek(0)  # Reset file pointer
-        reader = csv.DictReader(csv_file)
+    with open(csv_file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as csv_file:
+        # Plain csv.reader rows are lists, so no dict is allocated per row;
+        # the needed column positions are resolved once from the header
+        reader = csv.reader(csv_file)
+        fieldnames = next(reader, None) or []
+        attachments_index = fieldnames.index("Attachments") if "Attachments" in fieldnames else None
+        name_index = fieldnames.index("Full Name") if "Full Name" in fieldnames else None
         is_missing = False
 
         # Read the common attachments if needed
         if attachment_mode == "Common":
             first_row = next(reader, None)
             if first_row:
-                if first_row["Attachments"]:
-                    common_attachments = (first_row["Attachments"].split(";"))
+                first_attachments = first_row[attachments_index] if attachments_index is not None and len(first_row) > attachments_index else ""
+                if first_attachments:
+                    common_attachments = first_attachments.split(";")
                 else:
                     print(f"Error:\nSelected Attachment Mode \'Common\': But the first row attachment is not specified.\n")
                     exit(1)
+                # One directory scan answers every existence check below
+                existing_attachments = _list_dir_names(attachments_dir_path)
                 for attachment in common_attachments:
                     if not attachment or attachment.strip() == "":
                         is_missing = True
                         print(f"Error:\nSelected Attachment Mode \'Common\': But the first row attachment is not specified.\n")
-                    attachment_path = os.path.join(attachments_dir_path, attachment)
-                    if not os.path.exists(attachment_path):
+                    if attachment not in existing_attachments:
                         is_missing = True
                         print(f"Error:\nCommon attachment of first row not found in the Attachments Directory - {attachment}")
 
         elif attachment_mode == "Respective":
             missing_files =[]
+            # One directory scan replaces one stat syscall per attachment per row
+            existing_attachments = _list_dir_names(attachments_dir_path)
             for row_index, row in enumerate(reader, start=2):
-                if row.get("Attachments", ""):
-                    attachments = row.get("Attachments", "").split(";")
-                    missing_files = [path.strip() for path in attachments if path.strip() and not os.path.exists(os.path.join(attachments_dir_path,path.strip()))]
+                row_attachments = row[attachments_index] if attachments_index is not None and len(row) > attachments_index else ""
+                if row_attachments:
+                    attachments = row_attachments.split(";")
+                    # Strip each entry once; the check itself is a set lookup
+                    stripped_paths = (path.strip() for path in attachments)
+                    missing_files = [path for path in stripped_paths if path and path not in existing_attachments]
                 else:
                     attachments = []
 
@@ -111,16 +181,19 @@ def check_attachments(csv_file_path, attachments_dir_path=None, attachment_mode=
                     print(f"Attachment not found - Row Index \'{row_index}\' - {missing_files}")
 
         elif attachment_mode == "Other":
-            for row_index, row in enumerate(reader, start=2):
-                name = row.get("Full Name", "").title().strip()
-                attachments = f"{name.title().strip().replace(' ', '_')}_certificate.pdf"
+            # The generated-certificates directory is loop-invariant; read the
+            # pointer file and scan the directory once before walking the rows
+            gen_certs_dir_path = os.path.join(automation_dir_path, "gen_certs_dir_path.txt")
+            with open(gen_certs_dir_path, "r") as file:
+                gen_certs_dir_path = file.read()
+            existing_certificates = _list_dir_names(gen_certs_dir_path)
 
-                gen_certs_dir_path = os.path.join(automation_dir_path, "gen_certs_dir_path.txt")
-                with open(gen_certs_dir_path, "r") as file:
-                    gen_certs_dir_path = file.read()
+            for row_index, row in enumerate(reader, start=2):
+                full_name = row[name_index] if name_index is not None and len(row) > name_index else ""
+                name = full_name.strip().title().replace(' ', '_')
+                attachments = f"{name}_certificate.pdf"
 
-                attachment_path = os.path.join(gen_certs_dir_path, attachments)
-                if not os.path.exists(attachment_path):
+                if attachments not in existing_certificates:
                     is_missing = True
                     print(f"Attachment not found: Row Index \'{row_index}\' - {attachments}")
 
@@ -144,8 +217,8 @@ def clean_csv_fieldnames(file_path):
     print("\nCleaning field names in the CSV file...")
     try:
         # Read the file content
-        with open(file_path, 'r') as txt_file:
-            rows = txt_file.readlines()
+        with open(file_path, 'r', buffering=_READ_BUFFER_SIZE) as txt_file:
+            rows = txt_file.read().splitlines()
 
         if not rows:
             print("The CSV file is empty!\nNo valid rows found in the CSV file.\n")
@@ -213,9 +286,9 @@ def check_body_template(body_template_path):
     """
 
     try:
-        with open(body_template_path, "r") as body_file:
-            lines = body_file.readlines()
-            lines = [line for line in lines if line.strip()]
+        with open(body_template_path, "r", buffering=_READ_BUFFER_SIZE) as body_file:
+            # One read + splitlines avoids the per-line list readlines builds
+            lines = [line for line in body_file.read().splitlines() if line.strip()]
     except:
         print("\nError in reading HTML file.\nPlease ensure that the file is not corrupted!\n\nExiting...\n")
         exit(1)
@@ -224,11 +297,14 @@ def check_body_template(body_template_path):
         print("\nEmpty HTML body template file\nPlease enter valid HTML contents and check it's rendering before script execution.\n\nExiting...\n")
         exit(1)
 
-    if all(line.lstrip().startswith("<!--") and line.rstrip().endswith("-->") for line in lines):
-        print("\nEvery line is commented in HTML body template file\nPlease enter valid HTML contents and check it's rendering before script execution.\n\nExiting...\n")
-        exit(1)
+    # Both rejected shapes begin and end with comment markers, so one pair of
+    # startswith/endswith on the joined content gates the per-line scan
+    content = "\n".join(lines).strip()
+    if content.startswith("<!--") and content.endswith("-->"):
+        if all(line.lstrip().startswith("<!--") and line.rstrip().endswith("-->") for line in lines):
+            print("\nEvery line is commented in HTML body template file\nPlease enter valid HTML contents and check it's rendering before script execution.\n\nExiting...\n")
+            exit(1)
 
-    if lines[0].startswith("<!--") and lines[-1].strip().endswith("-->"):
         print("\nThe body template file has contents commented.\nPlease enter valid HTML contents and check it's rendering before script execution.\n\nExiting...\n")
         exit(1)
 
@@ -251,59 +327,74 @@ def check_csv(csv_file_path, attachment_mode, additional_column=None):
         Exits the program if the CSV file is missing required columns, contains invalid rows, or is corrupted.
     """
     print("\nChecking the CSV file for required columns and data integrity...")
-    # Open the CSV file
-    with open(csv_file_path, "r", encoding="utf-8") as csv_file:
-        csv_file.seek(0)
-        reader = csv.DictReader(csv_file)
+    # Open the CSV file; a plain csv.reader tokenizes the file once instead
+    # of re-parsing it per check and hashing every row into a dict
+    with open(csv_file_path, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as csv_file:
+        reader = csv.reader(csv_file)
         try:
-            # Check if the file is not empty and contains rows after the header
-            rows = list(reader)
-        except:
+            fieldnames = next(reader, None)
+        except (csv.Error, UnicodeError):
             print("Error in reading CSV file.\nEnsure that the file is not corrupted.\n\nExiting...\n")
             exit(1)
 
-        csv_file.seek(0)
-        reader = csv.DictReader(csv_file)
-        if not rows or not reader.fieldnames:  # If rows is empty, only the header or completely empty file
+        if not fieldnames:  # Completely empty file
             print("The CSV file is either empty or only contains the header.\n")
             exit(1)
 
-        csv_file.seek(0)
-        reader = csv.DictReader(csv_file)
         required_columns = {"Full Name", "Email"}
         if additional_column:
             required_columns.add(additional_column)
-        missing_columns = required_columns - set(reader.fieldnames or [])
+        missing_columns = required_columns - set(fieldnames)
         try:
             if missing_columns:
                 raise ValueError(f"\nMissing required columns in the CSV file: [{', '.join(missing_columns)}]\n")
 
-            if attachment_mode in {"Respective", "Common"} and "Attachments" not in reader.fieldnames:
+            if attachment_mode in {"Respective", "Common"} and "Attachments" not in fieldnames:
                 raise ValueError(f"The 'Attachments' column is required for the selected ATTACHMENT_MODE i.e \'{attachment_mode}\'\n")
         except Exception as e:
             print(f"Error:{e}")
             exit(1)
 
-        csv_file.seek(0)
-        reader = csv.DictReader(csv_file)
+        # Cache the column positions once; indexed access needs no per-row dict
+        name_index = fieldnames.index("Full Name")
+        email_index = fieldnames.index("Email")
+        additional_index = fieldnames.index(additional_column) if additional_column else None
+
         duplicate_emails = []
         email_map = {}
         invalid_rows = []
-        for row_index, row in enumerate(reader, start=2):
-            if not row.get("Full Name", "") or not row.get("Email", ""):
-                invalid_rows.append(row_index)
-                continue
-            if row.get("Full Name", "").strip() == "" or row.get("Email", "").strip() == "":
-                invalid_rows.append(row_index)
-            if additional_column and (not row.get(additional_column, "") or row.get(additional_column, "").strip() == "" or row.get(additional_column, "").strip().upper() not in {"TRUE", "FALSE"}):
-                invalid_rows.append(row_index)
-
-            email = row.get("Email", "").strip()
-            # Map emails to their row indices and associated names
-            if email not in email_map:
-                email_map[email] = {"indices": [], "names": set()}
-            email_map[email]["indices"].append(row_index)
-            email_map[email]["names"].add(row.get("Full Name", ""))
+        row_count = 0
+        try:
+            # Stream the rows straight off the reader; nothing is materialized,
+            # so peak memory stays flat no matter how large the roster is
+            for row_index, row in enumerate(reader, start=2):
+                row_count += 1
+                full_name = row[name_index] if len(row) > name_index else ""
+                email = row[email_index] if len(row) > email_index else ""
+
+                if not full_name or not email:
+                    invalid_rows.append(row_index)
+                    continue
+                if full_name.strip() == "" or email.strip() == "":
+                    invalid_rows.append(row_index)
+                if additional_index is not None:
+                    additional = row[additional_index] if len(row) > additional_index else ""
+                    if additional.strip().upper() not in {"TRUE", "FALSE"}:
+                        invalid_rows.append(row_index)
+
+                email = email.strip()
+                # Map emails to their row indices and associated names
+                if email not in email_map:
+                    email_map[email] = {"indices": [], "names": set()}
+                email_map[email]["indices"].append(row_index)
+                email_map[email]["names"].add(full_name)
+        except (csv.Error, UnicodeError):
+            print("Error in reading CSV file.\nEnsure that the file is not corrupted.\n\nExiting...\n")
+            exit(1)
+
+        if row_count == 0:  # Only the header, no data rows
+            print("The CSV file is either empty or only contains the header.\n")
+            exit(1)
 
         duplicate_emails = {email: details for email, details in email_map.items() if len(details["indices"]) > 1}
 
@@ -371,7 +462,9 @@ def get_files(directory, extension):
     """
 
     try:
-        files_list = [file for file in os.listdir(directory) if file.endswith(f'.{extension.lower()}')]
+        suffix = f'.{extension.lower()}'
+        with os.scandir(directory) as entries:
+            files_list = [entry.name for entry in entries if entry.is_file() and entry.name.endswith(suffix)]
     except FileNotFoundError as e:
         print(f"\nError reading file: {e}")
         exit(1)
@@ -432,14 +525,19 @@ def initialize_necessary_files(body_template_file=None, log_file=None):
         None
     """
 
-    for file in [body_template_file, log_file]:
+    # Map each file to its initial content; open(..., 'x') creates the file
+    # only when missing in a single atomic syscall, with no exists() check
+    # racing against the create
+    defaults = {body_template_file: default_html_code, log_file: ""}
+    for file, content in defaults.items():
         if not file:
             continue
-        if not os.path.exists(file):
-            with open(file, 'w') as f:
-                if file == body_template_file:
-
-                    f.write(default_html_code)
+        try:
+            with open(file, 'x') as f:
+                if content:
+                    f.write(content)
+        except FileExistsError:
+            pass
 
 
 ## --------------------------------------------------------------------------
@@ -500,7 +598,7 @@ def read_email_body_template(body_template_file):
     """
 
     try:
-        with open(body_template_file, "r", encoding="utf-8") as file:
+        with open(body_template_file, "r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as file:
             return file.read()
     except Exception as e:
         logging.error(f"Error reading HTML body template file\n{e}")
@@ -524,11 +622,18 @@ def read_wordlist(file_path):
         Exits the program if the wordlist contains invalid characters or is empty.
     """
 
-    valid_chars = set(ascii_letters + " ")
-
     try:
-        with open(file_path, "r") as file:
-            lines = file.readlines()
+        # Stream the file line-by-line so only the stripped names are kept,
+        # noting whether any blank or padded line would need cleaning up
+        with open(file_path, "r", buffering=_READ_BUFFER_SIZE) as file:
+            non_empty_lines = []
+            needs_rewrite = False
+            for raw_line in file:
+                line = raw_line.strip()
+                if line:
+                    non_empty_lines.append(line)
+                if not line or line != raw_line.rstrip("\n"):
+                    needs_rewrite = True
     except UnicodeError as e:
         print(f"\nError in reading TXT wordlist!\nThe file has some invalid characters or is not UTF-8 encoded. Please review the file and try again.\n\nExiting...\n")
         exit(1)
@@ -536,16 +641,17 @@ def read_wordlist(file_path):
         print("\nError in reading TXT wordlist!\nPlease ensure that the file is not corrupted.\n\nExiting...\n")
         exit(1)
 
-    non_empty_lines = [line.strip() for line in lines if line.strip()]
-
     if not non_empty_lines:
         print("\nError: Wordlist is empty or only contained blank lines.\n\nExiting...\n")
         exit(1)
 
     errors = []
-    for index, name in enumerate(non_empty_lines, start=1):
-        if not all(char in valid_chars for char in name):
-            errors.append(f"Line {index}: '{name}'")
+    # One C-level translate over the whole wordlist decides the common valid
+    # case; the per-line pass only runs to report offending line numbers
+    if "".join(non_empty_lines).translate(_VALID_NAME_CHARS_TABLE):
+        for index, name in enumerate(non_empty_lines, start=1):
+            if name.translate(_VALID_NAME_CHARS_TABLE):
+                errors.append(f"Line {index}: '{name}'")
 
     if errors:
         print("\nError: Invalid names in wordlist (only alphabets and spaces allowed):")
@@ -555,8 +661,11 @@ def read_wordlist(file_path):
 
     sorted_names = sorted(non_empty_lines, key=str.title)
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.write("\n".join(sorted_names))
+    # A wordlist that is already clean and sorted (the common case after the
+    # first run) needs no write-back at all
+    if needs_rewrite or sorted_names != non_empty_lines:
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(sorted_names))
 
     return sorted_names
 
@@ -577,7 +686,6 @@ def select_font(fonts_directory_path):
         Exits the program if no fonts are available or the user input is invalid.
     """
 
-    font_dict = {}
     truetype_font_files = sorted(get_files(fonts_directory_path, 'TTF'))
 
     if len(truetype_font_files) < 1:
@@ -585,12 +693,13 @@ def select_font(fonts_directory_path):
         exit(1)
 
     print("\nSelect a font for the Names:")
-    for index, font_name in enumerate(truetype_font_files):
-        print(f"  {index + 1}. {font_name[:-4]}")
-        font_dict[index + 1] = font_name
+    for index, font_name in enumerate(truetype_font_files, start=1):
+        print(f"  {index}. {font_name[:-4]}")
     try:
         font = int(input("\n--> "))
-        font_file = font_dict[font]
+        if not 1 <= font <= len(truetype_font_files):
+            raise ValueError()
+        font_file = truetype_font_files[font - 1]
     except KeyboardInterrupt:
         print("\n\nKeyboard Interrupt!\n\nExiting...\n")
         exit(1)
@@ -620,8 +729,8 @@ def sort_csv(file_path):
     try:
         FORBIDDEN_CHARS = r'[\/:*?"<>|]'
         # Read the file and split into lines
-        with open(file_path, 'r', encoding='utf-8') as txt_file:
-            rows = txt_file.readlines()
+        with open(file_path, 'r', encoding='utf-8', buffering=_READ_BUFFER_SIZE) as txt_file:
+            rows = txt_file.read().splitlines()
 
         # Extract header and data rows
         header = rows.pop(0).strip()
@@ -655,11 +764,15 @@ def sort_csv(file_path):
         print("'Full Name' column not found in the file header!\n\nExiting...\n")
         exit(1)
 
-    # Sort the data rows based on the "Full Name" field
-    sorted_data = sorted(
-        data_rows,
-        key=lambda row: row.split(",")[name_column_index].strip() if len(row.split(",")) > name_column_index else ""
-    )
+    # Sort the data rows based on the "Full Name" field; each row is split
+    # once, and only up to the name column instead of tokenizing the whole line
+    maxsplit = name_column_index + 1
+
+    def row_key(row):
+        fields = row.split(",", maxsplit)
+        return fields[name_column_index].strip() if len(fields) > name_column_index else ""
+
+    sorted_data = sorted(data_rows, key=row_key)
 
     # Combine header with sorted data
     sorted_rows = [header] + sorted_data